@@ -1,33 +1,304 @@
 import os
 import sys
-import yaml
+import itertools
 import numpy as np
 from easydict import EasyDict
-import torch
 from collections import Counter
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
 # Add the project root to Python path to ensure imports work
 project_root = os.path.dirname(os.path.abspath(__file__))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
 from pose_estimation.single_cube_dataset import SingleCubeDataset
+from pose_estimation.yaml_loader import load_yaml
+
+
+def _quaternion_right_product_matrix(q):
+    """
+    Builds the 4x4 matrix M such that M @ p is the Hamilton product p * q,
+    with quaternions stored as (q_x, q_y, q_z, q_w).
+    """
+    x, y, z, w = q
+    return np.array([
+        [w, z, -y, x],
+        [-z, w, x, y],
+        [y, -x, w, z],
+        [-x, -y, -z, w],
+    ])
+
+
+def _cube_symmetry_quaternions():
+    """
+    Returns the 24 rotations mapping a cube onto itself as a (24, 4) array of
+    quaternions (q_x, q_y, q_z, q_w), one per rotation (the binary octahedral
+    group with q and -q merged).
+    """
+    r = np.sqrt(0.5)
+    quaternions = []
+    # identity and the 180 degree face rotations
+    for axis in range(4):
+        q = [0.0] * 4
+        q[axis] = 1.0
+        quaternions.append(q)
+    # 120 degree rotations about the body diagonals
+    for xyz in itertools.product((0.5, -0.5), repeat=3):
+        quaternions.append(list(xyz) + [0.5])
+    # 90 degree face rotations and 180 degree edge rotations
+    for i, j in itertools.combinations(range(4), 2):
+        for sign in (1.0, -1.0):
+            q = [0.0] * 4
+            q[i] = r
+            q[j] = sign * r
+            quaternions.append(q)
+    return np.array(quaternions)
+
+
+CUBE_SYMMETRY_TRANSFORMS = np.stack(
+    [_quaternion_right_product_matrix(q) for q in _cube_symmetry_quaternions()]
+)
+
+
+def _lexicographic_argmax(candidates, order):
+    """
+    Index of the lexicographically largest candidate along axis 1, comparing
+    the components in the given order. Used to break ties deterministically.
+
+    Args:
+        candidates (np.ndarray): (N, K, 4) array of candidate quaternions.
+        order (tuple): component indices, most significant first.
 
+    Returns:
+        np.ndarray: (N,) array of indices into axis 1.
+    """
+    mask = np.ones(candidates.shape[:2], dtype=bool)
+    for component in order:
+        values = np.where(mask, candidates[:, :, component], -np.inf)
+        mask &= values == values.max(axis=1, keepdims=True)
+    return np.argmax(mask, axis=1)
+
+
+def canonicalize_quaternions(orientations_np, symmetric=False, decimals=6, chunk_size=4096):
+    """
+    Maps every quaternion onto a single representative of the rotation it
+    describes, so that equal rotations also compare equal element-wise.
+    Among the candidates q and -q (and, for a symmetric cube, the 24
+    equivalent orientations q * s generated through a (24, 4, 4) transform
+    tensor), the one with the largest q_w (smallest rotation angle) is kept,
+    ties being broken by the largest (q_x, q_y, q_z). Candidates are rounded
+    first, so that equivalent inputs which only differ by floating point
+    error end up with identical bytes.
 
-def inspect_dataset_annotations(config_path, data_root_path):
+    Args:
+        orientations_np (np.ndarray): (N, 4) array of quaternions
+            (q_x, q_y, q_z, q_w).
+        symmetric (bool): whether the object has the symmetries of a cube.
+        decimals (int): number of decimals kept in the canonical form.
+        chunk_size (int): number of rows processed at a time, bounding the
+            size of the (chunk_size, 48, 4) float64 candidate array.
+
+    Returns:
+        np.ndarray: (N, 4) float32 array of canonical quaternions.
+    """
+    orientations_np = np.asarray(orientations_np, dtype=np.float64)
+    canonical = np.empty(orientations_np.shape, dtype=np.float32)
+
+    for start in range(0, len(orientations_np), chunk_size):
+        chunk = orientations_np[start:start + chunk_size]
+        if symmetric:
+            candidates = np.einsum('kij,nj->nki', CUBE_SYMMETRY_TRANSFORMS, chunk)
+        else:
+            candidates = chunk[:, None, :]
+        candidates = np.concatenate([candidates, -candidates], axis=1)
+        # -0.0 and 0.0 have different bytes, fold them before byte-wise comparisons
+        candidates = np.round(candidates, decimals) + 0.0
+
+        best = _lexicographic_argmax(candidates, order=(3, 0, 1, 2))
+        canonical[start:start + chunk_size] = candidates[np.arange(len(chunk)), best]
+
+    return canonical
+
+
+if numba is not None:
+
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _orientation_statistics_kernel(a, block_size):
+        """
+        Fused single-pass mean/M2/min/max over blocks of rows. Each block is
+        reduced by its own thread with Welford's update, then the per-block
+        partials are merged with Chan's formula.
+        """
+        n, d = a.shape
+        n_blocks = (n + block_size - 1) // block_size
+        counts = np.zeros(n_blocks)
+        means = np.zeros((n_blocks, d))
+        m2s = np.zeros((n_blocks, d))
+        mins = np.empty((n_blocks, d))
+        maxs = np.empty((n_blocks, d))
+
+        for b in numba.prange(n_blocks):
+            start = b * block_size
+            stop = min(start + block_size, n)
+            for j in range(d):
+                mins[b, j] = a[start, j]
+                maxs[b, j] = a[start, j]
+            for i in range(start, stop):
+                k = i - start + 1
+                for j in range(d):
+                    x = np.float64(a[i, j])
+                    delta = x - means[b, j]
+                    means[b, j] += delta / k
+                    m2s[b, j] += delta * (x - means[b, j])
+                    mins[b, j] = min(mins[b, j], x)
+                    maxs[b, j] = max(maxs[b, j], x)
+            counts[b] = stop - start
+
+        count = 0.0
+        mean = np.zeros(d)
+        m2 = np.zeros(d)
+        minimum = mins[0].copy()
+        maximum = maxs[0].copy()
+        for b in range(n_blocks):
+            total = count + counts[b]
+            for j in range(d):
+                delta = means[b, j] - mean[j]
+                mean[j] += delta * counts[b] / total
+                m2[j] += m2s[b, j] + delta * delta * count * counts[b] / total
+                minimum[j] = min(minimum[j], mins[b, j])
+                maximum[j] = max(maximum[j], maxs[b, j])
+            count = total
+
+        return mean, np.sqrt(m2 / count), minimum, maximum
+
+    @numba.njit(cache=True)
+    def _unique_row_indices_kernel(packed):
+        """
+        Indices of the first occurrence of each distinct row of a (N, 2)
+        uint64 array, found with a hash set in a single pass.
+        """
+        seen = {(packed[0, 0], packed[0, 1])}
+        indices = [0]
+        for i in range(1, packed.shape[0]):
+            key = (packed[i, 0], packed[i, 1])
+            if key not in seen:
+                seen.add(key)
+                indices.append(i)
+        return np.array(indices)
+
+
+def _check_numba(use_numba):
+    if use_numba and numba is None:
+        raise ImportError("use_numba=True requires numba to be installed")
+
+
+def unique_orientation_indices(orientations_np, use_numba=False):
+    """
+    Finds the first occurrence of every distinct orientation. Rows are
+    compared through their raw bytes: by default each row is viewed as a
+    single opaque value so np.unique runs over a 1-D array instead of
+    comparing the quaternions element by element, with use_numba each
+    16-byte row is read as two uint64 and hashed by a compiled kernel.
+
+    Args:
+        orientations_np (np.ndarray): (N, 4) float32 array of quaternions.
+        use_numba (bool): use the numba kernel instead of NumPy.
+
+    Returns:
+        np.ndarray: indices of the unique rows, in dataset order.
+    """
+    _check_numba(use_numba)
+    rows = np.ascontiguousarray(orientations_np, dtype=np.float32)
+    if len(rows) == 0:
+        return np.empty(0, dtype=np.int64)
+    if use_numba:
+        return _unique_row_indices_kernel(rows.view(np.uint64))
+
+    row_dtype = np.dtype((np.void, rows.dtype.itemsize * rows.shape[1]))
+    packed_rows = rows.view(row_dtype).ravel()
+    _, unique_index = np.unique(packed_rows, return_index=True)
+    return np.sort(unique_index)
+
+
+def orientation_statistics(orientations_np, chunk_size=65536, use_numba=False):
+    """
+    Computes the per-component mean, standard deviation, min and max of the
+    orientations in a single pass over the array, optionally with a compiled
+    parallel kernel. Chunks are small enough to stay in cache and are merged
+    with Chan's parallel variant of Welford's algorithm, so the variance does
+    not suffer from sum-of-squares cancellation.
+
+    Args:
+        orientations_np (np.ndarray): (N, 4) array of quaternions.
+        chunk_size (int): number of rows reduced at a time.
+        use_numba (bool): use the numba kernel instead of NumPy. The kernel
+            is compiled on first use, which usually costs more than the NumPy
+            reduction itself unless the dataset is very large.
+
+    Returns:
+        dict: statistic name mapped to a (4,) array, NaN for an empty array.
+    """
+    _check_numba(use_numba)
+    n_components = orientations_np.shape[1]
+    if len(orientations_np) == 0:
+        nan = np.full(n_components, np.nan)
+        return {'Mean': nan, 'Std Dev': nan.copy(), 'Min': nan.copy(), 'Max': nan.copy()}
+
+    if use_numba:
+        mean, std, minimum, maximum = _orientation_statistics_kernel(
+            np.ascontiguousarray(orientations_np), chunk_size
+        )
+        return {'Mean': mean, 'Std Dev': std, 'Min': minimum, 'Max': maximum}
+
+    count = 0
+    mean = np.zeros(n_components)
+    m2 = np.zeros(n_components)
+    minimum = np.full(n_components, np.inf)
+    maximum = np.full(n_components, -np.inf)
+
+    for start in range(0, len(orientations_np), chunk_size):
+        chunk = orientations_np[start:start + chunk_size].astype(np.float64)
+        chunk_count = len(chunk)
+        chunk_mean = chunk.sum(axis=0) / chunk_count
+        chunk_m2 = np.square(chunk - chunk_mean).sum(axis=0)
+
+        delta = chunk_mean - mean
+        total = count + chunk_count
+        mean += delta * chunk_count / total
+        m2 += chunk_m2 + delta ** 2 * count * chunk_count / total
+        count = total
+
+        np.minimum(minimum, chunk.min(axis=0), out=minimum)
+        np.maximum(maximum, chunk.max(axis=0), out=maximum)
+
+    return {
+        'Mean': mean,
+        'Std Dev': np.sqrt(m2 / count),
+        'Min': minimum,
+        'Max': maximum,
+    }
+
+
+def inspect_dataset_annotations(config_path, data_root_path, use_numba=False):
     """
     Loads the training dataset and analyzes the variation in orientation annotations.
 
     Args:
         config_path (str): Path to the config.yaml file.
         data_root_path (str): The local path to the root data directory.
+        use_numba (bool): Compute the unique count and statistics with the
+            numba kernels (requires numba, worth it for very large datasets).
     """
     print("--- Starting Data Inspection ---")
 
     # 1. Load configuration from YAML
     try:
         with open(config_path, 'r') as f:
-            config = EasyDict(yaml.safe_load(f))
+            config = EasyDict(load_yaml(f))
         print(f"✅ Configuration loaded from '{config_path}'")
     except FileNotFoundError:
         print(f"❌ ERROR: Config file not found at '{config_path}'")
@@ -59,28 +330,27 @@ def inspect_dataset_annotations(config_path, data_root_path):
         print(f"❌ ERROR: Failed to create SingleCubeDataset object: {e}")
         return
 
-    # 4. Iterate through the dataset to collect annotations
-    orientations = []
-    data_loader = torch.utils.data.DataLoader(dataset, batch_size=1)
-
+    # 4. Read the orientation annotations. Only the labels are needed here,
+    # so the images are never opened.
     print("\n--- Processing Samples ---")
-    for i, (_, _, target_orient) in enumerate(data_loader):
-        # The dataloader returns a batch, so we get the first item
-        orientations.append(target_orient.squeeze().numpy())
-        if (i + 1) % 100 == 0:
-            print(f"Processed {i + 1} samples...")
+    orientations_np = dataset.get_all_orientations()
+    num_samples = len(orientations_np)
 
-    if not orientations:
+    if num_samples == 0:
         print("❌ ERROR: No orientation data could be loaded from the dataset.")
         return
 
-    print(f"✅ Finished processing. Total samples loaded: {len(orientations)}.")
+    print(f"✅ Finished processing. Total samples loaded: {num_samples}.")
 
     # 5. Analyze the collected data for variation
-    orientations_np = np.array(orientations)
-
-    # Find unique orientations
-    unique_orientations = np.unique(orientations_np, axis=0)
+    # Find unique orientations. Quaternions are canonicalized first so that
+    # q and -q (and the cube's symmetric poses) count as a single rotation.
+    canonical_np = canonicalize_quaternions(
+        orientations_np, symmetric=np.any(config.dataset.symmetric)
+    )
+    unique_orientations = canonical_np[
+        unique_orientation_indices(canonical_np, use_numba=use_numba)
+    ]
 
     print("\n--- Annotation Analysis Results ---")
     print(f"Total annotations processed: {len(orientations_np)}")
@@ -98,12 +368,7 @@ def inspect_dataset_annotations(config_path, data_root_path):
         print("🟢 Good variation detected in orientation annotations.")
 
     # Calculate and display statistics
-    stats = {
-        'Mean': np.mean(orientations_np, axis=0),
-        'Std Dev': np.std(orientations_np, axis=0),
-        'Min': np.min(orientations_np, axis=0),
-        'Max': np.max(orientations_np, axis=0),
-    }
+    stats = orientation_statistics(orientations_np, use_numba=use_numba)
 
     print("\n--- Quaternion Component Statistics (q_x, q_y, q_z, q_w) ---")
     print(f"{'Stat':<10} | {'q_x':<15} | {'q_y':<15} | {'q_z':<15} | {'q_w':<15}")
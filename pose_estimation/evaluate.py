@@ -34,6 +34,7 @@ def evaluate_model(estimator):
         batch_size=config.test.batch_test_size,
         num_workers=0,
         drop_last=False,
+        pin_memory=torch.cuda.is_available(),
     )
 
     estimator.model.to(estimator.device)
@@ -113,10 +114,16 @@ def evaluation_over_batch(
         optimizer: optimizer of the model
         criterion_translation (torch.nn): criterion for the evaluation of the translation loss
         criterion_orientation torch.nn: criterion for the evaluation of the orientation loss
+
+    Returns:
+        the translation and orientation metrics averaged over the batches
     """
 
-    sample_size = config.train.sample_size_train if is_training else config.val.sample_size_val
-    len_data_loader = sample_size if (sample_size > 0) else len(data_loader)
+    # The metrics are per-batch averages, so their sum is divided by the
+    # number of batches actually seen. This used to be the sample size when
+    # sampling, or len(data_loader), which differs from the batches seen
+    # when the loader uses several workers.
+    num_batches = 0
 
     metric_translation = 0
     metric_orientation = 0
@@ -124,7 +131,8 @@ def evaluation_over_batch(
     for index, (images, target_translation_list, target_orientation_list) in enumerate(
             data_loader
     ):
-        images = list(image.to(estimator.device) for image in images)
+        images = list(image.to(estimator.device, non_blocking=True) for image in images)
+        num_batches += 1
 
         loss_translation = 0
         loss_orientation = 0
@@ -136,8 +144,12 @@ def evaluation_over_batch(
                 )
             )
 
-            target_translation = target_translation_list.to(estimator.device)
-            target_orientation = target_orientation_list.to(estimator.device)
+            target_translation = target_translation_list.to(
+                estimator.device, non_blocking=True
+            )
+            target_orientation = target_orientation_list.to(
+                estimator.device, non_blocking=True
+            )
 
             metric_translation += translation_average_mean_square_error(
                 output_translation, target_translation
@@ -175,7 +187,9 @@ def evaluation_over_batch(
                 )
             )
 
-            target_translation = target_translation_list.to(estimator.device)
+            target_translation = target_translation_list.to(
+                estimator.device, non_blocking=True
+            )
 
             metric_translation += translation_average_mean_square_error(
                 output_translation, target_translation
@@ -200,7 +214,7 @@ def evaluation_over_batch(
                 optimizer.step()
                 optimizer.zero_grad()
 
-    metric_translation = metric_translation / len_data_loader
-    metric_orientation = metric_orientation / len_data_loader
+    metric_translation = metric_translation / max(num_batches, 1)
+    metric_orientation = metric_orientation / max(num_batches, 1)
 
     return metric_translation, metric_orientation
\ No newline at end of file
@@ -1,6 +1,7 @@
 import copy
 import os
 import logging
+from types import SimpleNamespace
 from pose_estimation.logger import Logger
 from .storage.checkpoint import EstimatorCheckpoint
 
@@ -111,8 +112,8 @@ class PoseEstimationEstimator:
         checkpoint = torch.load(path, map_location=self.device)
         self.model.load_state_dict(checkpoint["model"])
 
-        loaded_config = copy.deepcopy(checkpoint["config"])
-        stored_config = copy.deepcopy(self.config)
+        loaded_config = _config_to_dict(checkpoint["config"])
+        stored_config = _config_to_dict(self.config)
         del stored_config["checkpoint"]["load_dir_checkpoint"]
         if stored_config != loaded_config:
             self.logger.warning(
@@ -121,3 +122,21 @@ class PoseEstimationEstimator:
                 f"{loaded_config}. However, the current config is: "
                 f"{self.config}."
             )
+
+
+def _config_to_dict(config):
+    """
+    Deep copy a config into plain nested dicts so that configs built as
+    EasyDict (cli.py) and SimpleNamespace (run_training.py) compare equal
+
+    Args:
+        config: estimator config
+
+    Returns:
+        (dict): copy of the config
+    """
+    if isinstance(config, SimpleNamespace):
+        config = vars(config)
+    if isinstance(config, dict):
+        return {key: _config_to_dict(value) for key, value in config.items()}
+    return copy.deepcopy(config)
@@ -3,6 +3,7 @@ from pathlib import Path
 import zipfile
 import json
 import glob
+import itertools
 
 import numpy as np
 
@@ -112,13 +113,41 @@ class SingleCubeDataset(torch.utils.data.IterableDataset):
         """
         iterator = RawDataIterator(path=self.root)
 
+        if self.sample_size > 0:
+            iterator = self._sample(iterator)
+
+        # Split the elements between the DataLoader workers so that
+        # each sample is only loaded once
+        worker_info = torch.utils.data.get_worker_info()
+        if worker_info is not None:
+            iterator = itertools.islice(
+                iterator, worker_info.id, None, worker_info.num_workers
+            )
+
         # Map each element
         mapped_itr = map(self.pre_processing, iterator)
 
+        return mapped_itr
+
+    def get_all_orientations(self):
+        """
+        Read the orientation annotations of the dataset without loading
+        or pre-processing the images
+
+        Returns:
+            (np.ndarray): (N, 4) float32 array of the quaternion elements,
+            in the same order (and with the same sampling) as __iter__
+        """
+        iterator = RawDataIterator(path=self.root)
+
         if self.sample_size > 0:
-            mapped_itr = self._sample(mapped_itr)
+            iterator = self._sample(iterator)
 
-        return mapped_itr
+        orientations = [
+            list(position_list[0]["rotation"].values())
+            for position_list, _ in iterator
+        ]
+        return np.array(orientations, dtype=np.float32).reshape(-1, 4)
 
     def __len__(self):
         """
@@ -225,6 +254,8 @@ class RawDataIterator:
         self.log_index = 0
         self.image_index = 0
         self.base_path = path
+        self._data = None
+        self._data_log_index = None
         for file in os.listdir(path):
             if file.startswith("Dataset"):
                 self.log_folder_path = os.path.join(path, file)
@@ -245,8 +276,7 @@ class RawDataIterator:
         """
         path = self._log_path()
         if os.path.exists(path):
-            file = open(path)
-            data = json.load(file)
+            data = self._load_log(path)
             if self.image_index >= len(data["captures"]):
                 # move to next log file
                 self.log_index += 1
@@ -264,6 +294,23 @@ class RawDataIterator:
 
     # HELPERS
 
+    def _load_log(self, path):
+        """
+        Load the json log file of the current log index, parsing it only
+        once for all the captures it contains
+
+        Attribute:
+            path (str): path towards the Logs file
+
+        Returns:
+            the data file as a json object
+        """
+        if self._data_log_index != self.log_index:
+            with open(path) as file:
+                self._data = json.load(file)
+            self._data_log_index = self.log_index
+        return self._data
+
     def _fetch_results(self, data):
         """
         Extract the result for a given line of a file
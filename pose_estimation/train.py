@@ -37,17 +37,34 @@ def train_model(estimator):
         sample_size=config.val.sample_size_val,
     )
 
+    # SingleCubeDataset splits its captures between the workers and each
+    # worker batches its own share. With drop_last=True every worker drops
+    # its own partial last batch, so the training loader can skip up to
+    # num_workers * (batch_size - 1) samples per epoch, and without
+    # drop_last the validation loader yields up to one short batch per
+    # worker. Workers are therefore opt-in (system.num_workers, default 0).
+    num_workers = getattr(config.system, "num_workers", 0)
+    worker_options = {}
+    if num_workers > 0:
+        # the loaders are re-iterated every epoch, so keep their workers
+        # alive instead of respawning them each time
+        worker_options = {"persistent_workers": True, "prefetch_factor": 4}
+
     train_loader = torch.utils.data.DataLoader(
         dataset_train,
         batch_size=config.train.batch_training_size,
-        num_workers=0,
+        num_workers=num_workers,
         drop_last=True,
+        pin_memory=torch.cuda.is_available(),
+        **worker_options,
     )
     val_loader = torch.utils.data.DataLoader(
         dataset_val,
         batch_size=config.val.batch_validation_size,
-        num_workers=0,
+        num_workers=num_workers,
         drop_last=False,
+        pin_memory=torch.cuda.is_available(),
+        **worker_options,
     )
 
     train_loop(
@@ -0,0 +1,29 @@
+import logging
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+try:
+    # LibYAML bindings parse much faster than the pure-Python loader
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+if not yaml.__with_libyaml__:
+    logger.warning(
+        "PyYAML was built without LibYAML, falling back to the pure-Python loader"
+    )
+
+
+def load_yaml(stream):
+    """
+    Parse a YAML document with the fastest available safe loader
+
+    Args:
+        stream: opened YAML file or string
+
+    Returns:
+        the parsed document
+    """
+    return yaml.load(stream, Loader=SafeLoader)
@@ -6,40 +6,87 @@ This script can be run directly to train the pose estimation model.
 import os
 import sys
 import argparse
-import yaml
-from easydict import EasyDict
+import hashlib
+from functools import reduce
+import pickle
+import tempfile
+from types import SimpleNamespace
 
 # Add the project root to Python path to ensure imports work
 project_root = os.path.dirname(os.path.abspath(__file__))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
+from pose_estimation.yaml_loader import load_yaml
+
+CONFIG_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "rosproject")
+
+
+def _read_config_file(config_file):
+    """Parse a YAML config file, reusing a pickled copy when the file is unchanged"""
+    config_file = os.path.abspath(config_file)
+    stat = os.stat(config_file)
+    # mtime alone misses edits that preserve it (cp -p, rsync -t)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    # One cache entry per config path, overwritten whenever the file changes
+    key = hashlib.md5(config_file.encode()).hexdigest()
+    cache_file = os.path.join(CONFIG_CACHE_DIR, f"{key}.pkl")
+
+    try:
+        with open(cache_file, 'rb') as f:
+            cached = pickle.load(f)
+        if cached["signature"] == signature:
+            return cached["config"]
+    except Exception:
+        # a missing or damaged cache entry is simply rebuilt
+        pass
 
-def load_config(config_file="/scratch/hpc/11/xiar3/RosProject/config.yaml", **overrides):
-    """Load configuration from YAML file with optional overrides"""
     with open(config_file, 'r') as f:
-        config = yaml.load(f, Loader=yaml.FullLoader)
-
-    # Apply overrides
-    for key, value in overrides.items():
-        if value is not None:
-            if '.' in key:
-                # Handle nested keys like 'system.data_root'
-                keys = key.split('.')
-                current = config
-                for k in keys[:-1]:
-                    if k not in current:
-                        current[k] = {}
-                    current = current[k]
-                current[keys[-1]] = value
-            else:
-                config[key] = value
-
-    # Convert to EasyDict for easier access
-    config = EasyDict(config)
+        config = load_yaml(f)
+
+    # The cache is only an optimization, so an unwritable cache dir is not an error
+    # The temp file gets a unique name so that concurrent writers (e.g. job
+    # array tasks sharing ~/.cache over NFS) never write to the same file
+    try:
+        os.makedirs(CONFIG_CACHE_DIR, exist_ok=True)
+        fd, tmp_file = tempfile.mkstemp(dir=CONFIG_CACHE_DIR, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump({"signature": signature, "config": config}, f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, cache_file)
+        except BaseException:
+            os.unlink(tmp_file)
+            raise
+    except OSError:
+        pass
+
     return config
 
 
+def _to_namespace(d):
+    """Recursively convert nested dicts into SimpleNamespace objects"""
+    return SimpleNamespace(**{k: _to_namespace(v) if isinstance(v, dict) else v for k, v in d.items()})
+
+
+def load_config(config_file="/scratch/hpc/11/xiar3/RosProject/config.yaml", **overrides):
+    """Load configuration from YAML file with optional overrides"""
+    config = _read_config_file(config_file)
+
+    # Apply overrides, nested keys like 'system.data_root' are split once
+    # and walked with setdefault so missing sections are created
+    override_table = [
+        (tuple(key.split('.')), value)
+        for key, value in overrides.items()
+        if value is not None
+    ]
+    for path, value in override_table:
+        reduce(lambda d, k: d.setdefault(k, {}), path[:-1], config)[path[-1]] = value
+
+    # Convert to SimpleNamespace for plain attribute access
+    return _to_namespace(config)
+
+
 def validate_data_paths(config):
     """Validate that data directories exist"""
     data_root = config.system.data_root
@@ -51,17 +98,35 @@ def validate_data_paths(config):
     print(f"Training data: {train_data}")
     print(f"Validation data: {val_data}")
 
-    if not os.path.exists(data_root):
+    # List the data root once instead of stat-ing every path, each stat can
+    # be slow on network filesystems
+    try:
+        with os.scandir(data_root) as it:
+            entries = {entry.name: entry for entry in it}
+    except OSError:
+        # missing, not a directory, or traversable but not listable
+        entries = {}
+
+    def data_exists(name, path):
+        # A plain entry of data_root needs no further syscall. Anything else
+        # (not listed, case differences, ".", symlinks that may be broken,
+        # names with a directory component) goes through os.path.exists
+        entry = entries.get(name)
+        if entry is not None and not entry.is_symlink():
+            return True
+        return os.path.exists(path)
+
+    if not entries and not os.path.exists(data_root):
         print(f"WARNING: Data root directory does not exist: {data_root}")
         print(f"Please create it or specify a different path with --data-root")
         return False
 
-    if not os.path.exists(train_data):
+    if not data_exists(config.train.dataset_zip_file_name_training, train_data):
         print(f"WARNING: Training data directory does not exist: {train_data}")
         print(f"Please create it or specify a different name with --train-data-name")
         return False
 
-    if not os.path.exists(val_data):
+    if not data_exists(config.val.dataset_zip_file_name_validation, val_data):
         print(f"WARNING: Validation data directory does not exist: {val_data}")
         print(f"Please create it or specify a different name with --val-data-name")
         return False
@@ -101,6 +166,8 @@ def main():
                         help='Training batch size')
     parser.add_argument('--learning-rate', type=float, default=None,
                         help='Learning rate for optimizer')
+    parser.add_argument('--num-workers', type=int, default=None,
+                        help='Number of DataLoader worker processes (default: 0)')
 
     # Other options
     parser.add_argument('--check-data-only', action='store_true',
@@ -127,6 +194,8 @@ def main():
         overrides['train.batch_training_size'] = args.batch_size
     if args.learning_rate:
         overrides['adam_optimizer.lr'] = args.learning_rate
+    if args.num_workers is not None:
+        overrides['system.num_workers'] = args.num_workers
 
     # Load configuration
     config = load_config(args.config, **overrides)
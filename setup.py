@@ -37,6 +37,9 @@ EXTRAS = {
     "cloud": [
         "kfp==1.0.4",
         "google-cloud-storage",
+    ],
+    "fast": [
+        "numba",
     ]
 }
 
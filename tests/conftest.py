@@ -0,0 +1,8 @@
+import os
+import sys
+
+# The standalone scripts (run_training.py, datacheck.py) live at the project
+# root rather than in the pose_estimation package
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
@@ -0,0 +1,104 @@
+import numpy as np
+import pytest
+
+import datacheck
+
+
+@pytest.fixture
+def orientations():
+    """random (N, 4) float32 quaternions."""
+    rng = np.random.default_rng(0)
+    q = rng.normal(size=(1000, 4)).astype(np.float32)
+    return q / np.linalg.norm(q, axis=1, keepdims=True)
+
+
+class TestOrientationStatistics:
+    def test_matches_numpy_reductions(self, orientations):
+        # chunk_size smaller than N so that the chunks have to be merged
+        stats = datacheck.orientation_statistics(orientations, chunk_size=64)
+
+        np.testing.assert_allclose(stats["Mean"], np.mean(orientations, axis=0), rtol=1e-5, atol=1e-7)
+        np.testing.assert_allclose(stats["Std Dev"], np.std(orientations, axis=0), rtol=1e-5)
+        np.testing.assert_allclose(stats["Min"], np.min(orientations, axis=0))
+        np.testing.assert_allclose(stats["Max"], np.max(orientations, axis=0))
+
+    def test_empty(self):
+        stats = datacheck.orientation_statistics(np.empty((0, 4), dtype=np.float32))
+
+        for values in stats.values():
+            assert values.shape == (4,)
+            assert np.all(np.isnan(values))
+
+    def test_numba_parity(self, orientations):
+        pytest.importorskip("numba")
+        # chunk_size smaller than N so that the kernel reduces several blocks
+        expected = datacheck.orientation_statistics(orientations, chunk_size=64)
+        stats = datacheck.orientation_statistics(orientations, chunk_size=64, use_numba=True)
+
+        for name, values in expected.items():
+            np.testing.assert_allclose(stats[name], values, rtol=1e-6, atol=1e-9)
+
+        empty = datacheck.orientation_statistics(
+            np.empty((0, 4), dtype=np.float32), use_numba=True
+        )
+        assert np.all(np.isnan(empty["Mean"]))
+
+
+class TestUniqueOrientationIndices:
+    def test_first_occurrences(self, orientations):
+        q = np.concatenate([orientations[:5], orientations[:3], orientations[5:8]])
+
+        np.testing.assert_array_equal(
+            datacheck.unique_orientation_indices(q), [0, 1, 2, 3, 4, 8, 9, 10]
+        )
+        assert len(datacheck.unique_orientation_indices(q[:0])) == 0
+
+    def test_numba_parity(self, orientations):
+        pytest.importorskip("numba")
+        q = np.concatenate([orientations, orientations[::3], orientations[:1]])
+
+        np.testing.assert_array_equal(
+            datacheck.unique_orientation_indices(q, use_numba=True),
+            datacheck.unique_orientation_indices(q),
+        )
+        assert len(datacheck.unique_orientation_indices(q[:0], use_numba=True)) == 0
+
+
+class TestCanonicalizeQuaternions:
+    def test_cube_symmetry_quaternions(self):
+        symmetries = datacheck._cube_symmetry_quaternions()
+
+        assert symmetries.shape == (24, 4)
+        np.testing.assert_allclose(np.linalg.norm(symmetries, axis=1), 1.0)
+        # |<q_i, q_j>| == 1 iff q_i and q_j describe the same rotation
+        dots = np.abs(symmetries @ symmetries.T)
+        np.testing.assert_allclose(np.diag(dots), 1.0)
+        assert np.all(dots[~np.eye(24, dtype=bool)] < 1 - 1e-6)
+
+    @pytest.mark.parametrize("symmetric", [False, True])
+    def test_sign_collapses(self, orientations, symmetric):
+        canonical = datacheck.canonicalize_quaternions(
+            orientations, symmetric=symmetric, chunk_size=128
+        )
+        negated = datacheck.canonicalize_quaternions(-orientations, symmetric=symmetric)
+
+        np.testing.assert_array_equal(canonical, negated)
+        assert np.all(canonical[:, 3] >= 0)
+
+    def test_cube_symmetries_collapse(self, orientations):
+        # 45 degrees around z ties two candidates on |q_w|
+        tie = np.array([[0.0, 0.0, np.sin(np.pi / 8), np.cos(np.pi / 8)]])
+        q = np.concatenate([orientations.astype(np.float64), tie])
+        canonical = datacheck.canonicalize_quaternions(q, symmetric=True)
+
+        for s in datacheck._cube_symmetry_quaternions():
+            rotated = q @ datacheck._quaternion_right_product_matrix(s).T
+            np.testing.assert_array_equal(
+                datacheck.canonicalize_quaternions(rotated, symmetric=True), canonical
+            )
+
+    def test_unique_count(self, orientations):
+        q = np.concatenate([orientations, -orientations[:10]])
+        canonical = datacheck.canonicalize_quaternions(q)
+
+        assert len(datacheck.unique_orientation_indices(canonical)) == len(orientations)
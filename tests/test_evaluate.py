@@ -1,6 +1,10 @@
 from pose_estimation.pose_estimation_estimator import PoseEstimationEstimator
 from pose_estimation.single_cube_dataset import SingleCubeDataset
-from pose_estimation.evaluate import evaluate_models, evaluate_one_epoch
+from pose_estimation.evaluate import (
+    evaluate_model,
+    evaluate_one_epoch,
+    evaluation_over_batch,
+)
 from unittest.mock import MagicMock, patch
 import os
 import tempfile
@@ -56,6 +60,54 @@ class TestEvaluate:
 
         pose_estimation_estimator = PoseEstimationEstimator(config=config)
 
-        evaluate_models(estimator=pose_estimation_estimator)
+        evaluate_model(estimator=pose_estimation_estimator)
 
         mock_evaluate_one_epoch.assert_called_once()
+
+    def test_evaluation_over_batch_averages_over_batches(self, config):
+        """metrics are averaged over the batches seen, whatever the sample size."""
+        config.dataset.image_scale = 8
+        config.val.sample_size_val = 5
+        batch_size = 2
+        identity = torch.tensor([0.0, 0.0, 0.0, 1.0])
+
+        estimator = MagicMock()
+        estimator.device = torch.device("cpu")
+        estimator.model.is_symetric = False
+        estimator.model.side_effect = lambda images: (
+            torch.zeros(len(images), 3),
+            identity.repeat(len(images), 1),
+        )
+
+        # the translation error of batch k is k ** 2
+        data_loader = [
+            (
+                torch.zeros(batch_size, 1, 3, 8, 8),
+                torch.full((batch_size, 3), float(k)),
+                identity.repeat(batch_size, 1),
+            )
+            for k in (1, 2, 3)
+        ]
+
+        metric_translation, metric_orientation = evaluation_over_batch(
+            estimator=estimator,
+            config=config,
+            data_loader=data_loader,
+            batch_size=batch_size,
+            epoch=0,
+            is_training=False,
+        )
+
+        assert metric_translation == pytest.approx((1 + 4 + 9) / 3)
+        assert metric_orientation == pytest.approx(0)
+
+        metric_translation, metric_orientation = evaluation_over_batch(
+            estimator=estimator,
+            config=config,
+            data_loader=[],
+            batch_size=batch_size,
+            epoch=0,
+            is_training=False,
+        )
+        assert metric_translation == 0
+        assert metric_orientation == 0
@@ -0,0 +1,122 @@
+import os
+
+import pytest
+
+import run_training
+
+
+@pytest.fixture
+def config_file(tmp_path, monkeypatch):
+    """write a small config and redirect the config cache into tmp_path."""
+    monkeypatch.setattr(run_training, "CONFIG_CACHE_DIR", str(tmp_path / "cache"))
+    path = tmp_path / "config.yaml"
+    path.write_text("system:\n  data_root: /data\ntrain:\n  epochs: 1\n")
+    return path
+
+
+def _rewrite_keeping_mtime(path, text):
+    stat = os.stat(path)
+    path.write_text(text)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+
+def _fail_parse(*args, **kwargs):
+    raise AssertionError("the config should have been read from the cache")
+
+
+class TestLoadConfig:
+    def test_cache_hit_and_miss(self, config_file, tmp_path, monkeypatch):
+        config = run_training.load_config(str(config_file))
+        assert config.system.data_root == "/data"
+        assert len(os.listdir(tmp_path / "cache")) == 1
+
+        # unchanged file: the cached copy is returned without parsing
+        with monkeypatch.context() as m:
+            m.setattr(run_training, "load_yaml", _fail_parse)
+            config = run_training.load_config(str(config_file))
+        assert config.system.data_root == "/data"
+
+        # same mtime but a different size: the file is parsed again
+        _rewrite_keeping_mtime(config_file, "system:\n  data_root: /other\n")
+        config = run_training.load_config(str(config_file))
+        assert config.system.data_root == "/other"
+
+        # new mtime: the file is parsed again and the cache entry replaced
+        config_file.write_text("system:\n  data_root: /third\n")
+        stat = os.stat(config_file)
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        config = run_training.load_config(str(config_file))
+        assert config.system.data_root == "/third"
+        assert len(os.listdir(tmp_path / "cache")) == 1
+
+    def test_damaged_cache(self, config_file, tmp_path):
+        run_training.load_config(str(config_file))
+        (cache_file,) = (tmp_path / "cache").iterdir()
+        cache_file.write_bytes(b"\x80\x05not a pickle")
+
+        config = run_training.load_config(str(config_file))
+        assert config.system.data_root == "/data"
+        assert len(os.listdir(tmp_path / "cache")) == 1
+
+    def test_overrides(self, config_file):
+        config = run_training.load_config(
+            str(config_file),
+            **{
+                "system.data_root": "/scratch",
+                "estimator": "top_level",
+                "adam_optimizer.lr": 0.1,
+                "train.epochs": None,
+            },
+        )
+        assert config.system.data_root == "/scratch"
+        assert config.estimator == "top_level"
+        assert config.adam_optimizer.lr == 0.1
+        assert config.train.epochs == 1
+
+        # overrides are applied after loading and never reach the cache
+        config = run_training.load_config(str(config_file))
+        assert config.system.data_root == "/data"
+        assert not hasattr(config, "estimator")
+        assert not hasattr(config, "adam_optimizer")
+
+
+class TestValidateDataPaths:
+    def _config(self, data_root):
+        return run_training._to_namespace(
+            {
+                "system": {"data_root": str(data_root)},
+                "train": {"dataset_zip_file_name_training": "train"},
+                "val": {"dataset_zip_file_name_validation": "val"},
+            }
+        )
+
+    def test_missing_root(self, tmp_path):
+        assert not run_training.validate_data_paths(self._config(tmp_path / "missing"))
+
+    def test_missing_train(self, tmp_path):
+        (tmp_path / "val").mkdir()
+        assert not run_training.validate_data_paths(self._config(tmp_path))
+
+    def test_missing_val(self, tmp_path):
+        (tmp_path / "train").mkdir()
+        assert not run_training.validate_data_paths(self._config(tmp_path))
+
+    def test_all_present(self, tmp_path):
+        (tmp_path / "train").mkdir()
+        (tmp_path / "val").mkdir()
+        assert run_training.validate_data_paths(self._config(tmp_path))
+
+    def test_broken_symlink(self, tmp_path):
+        (tmp_path / "train").mkdir()
+        (tmp_path / "val").symlink_to(tmp_path / "gone")
+        assert not run_training.validate_data_paths(self._config(tmp_path))
+
+    def test_unlistable_root(self, tmp_path, monkeypatch):
+        (tmp_path / "train").mkdir()
+        (tmp_path / "val").mkdir()
+
+        def scandir(path):
+            raise PermissionError(path)
+
+        monkeypatch.setattr(run_training.os, "scandir", scandir)
+        assert run_training.validate_data_paths(self._config(tmp_path))
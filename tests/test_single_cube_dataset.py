@@ -2,9 +2,12 @@ from pose_estimation.single_cube_dataset import (
     SingleCubeDataset,
     RawDataIterator,
 )
+import json
 import os
 
 import pytest
+import torch
+from PIL import Image
 from yacs.config import CfgNode as CN
 
 data_root = os.path.join(os.getcwd(), "tests")
@@ -21,6 +24,36 @@ def config():
     return cfg
 
 
+@pytest.fixture
+def tmp_dataset(tmp_path):
+    """
+    write a tiny dataset in the Unity Perception layout: two capture logs
+    holding 5 annotated captures plus one capture without annotation
+    values, and one small image per annotated capture.
+    """
+    zip_name = "tmp_single_cube"
+    dataset_root = tmp_path / zip_name
+    (dataset_root / "Dataset1").mkdir(parents=True)
+    (dataset_root / "RGB1").mkdir()
+
+    captures = []
+    for i in range(5):
+        image_name = f"RGB1/rgb_{i}.png"
+        Image.new("RGB", (8, 8), (40 * i, 0, 0)).save(dataset_root / image_name)
+        value = {
+            "translation": {"x": float(i), "y": 0.5, "z": 1.5},
+            "rotation": {"x": 0.1 * i, "y": 0.2, "z": -0.3, "w": 0.9},
+        }
+        captures.append({"filename": image_name, "annotations": [{"values": [value]}]})
+    captures.insert(2, {"filename": "RGB1/missing.png", "annotations": [{"values": []}]})
+
+    for log_index, log_captures in enumerate([captures[:4], captures[4:]]):
+        log_file = dataset_root / "Dataset1" / f"captures_00{log_index}.json"
+        log_file.write_text(json.dumps({"captures": log_captures}))
+
+    return str(tmp_path), zip_name
+
+
 class TestSingleCubeDataset:
     def test_RawDataIterator(self, config):
         raw_data_iterator = RawDataIterator(path=root)
@@ -100,3 +133,62 @@ class TestSingleCubeDataset:
 
                 assert len(target_trans) == 3
                 assert len(target_orient) == 4
+
+    def test_get_all_orientations(self, config, tmp_dataset):
+        tmp_data_root, tmp_zip_file_name = tmp_dataset
+        dataset = SingleCubeDataset(
+            config=config,
+            data_root=tmp_data_root,
+            zip_file_name=tmp_zip_file_name,
+            sample_size=0,
+            download=False,
+        )
+        orientations = dataset.get_all_orientations()
+
+        # the capture without annotation values is skipped
+        assert orientations.shape == (5, 4)
+        targets_orient = [target_orient.tolist() for _, _, target_orient in dataset]
+        assert targets_orient == orientations.tolist()
+
+        dataset_sample = SingleCubeDataset(
+            config=config,
+            data_root=tmp_data_root,
+            zip_file_name=tmp_zip_file_name,
+            sample_size=2,
+        )
+        sample_orientations = dataset_sample.get_all_orientations()
+
+        assert sample_orientations.shape == (2, 4)
+        for orientation in sample_orientations.tolist():
+            assert orientation in orientations.tolist()
+
+    @pytest.mark.parametrize("num_workers", [2, 3])
+    @pytest.mark.parametrize("sample_size", [0, 3])
+    def test_worker_split(self, config, tmp_dataset, num_workers, sample_size):
+        tmp_data_root, tmp_zip_file_name = tmp_dataset
+        dataset = SingleCubeDataset(
+            config=config,
+            data_root=tmp_data_root,
+            zip_file_name=tmp_zip_file_name,
+            sample_size=sample_size,
+            download=False,
+        )
+        # spawn rather than fork: forking after another test has started
+        # numba's parallel thread pool deadlocks the workers
+        data_loader = torch.utils.data.DataLoader(
+            dataset,
+            batch_size=1,
+            num_workers=num_workers,
+            multiprocessing_context="spawn",
+        )
+
+        def captures(batches):
+            return sorted(
+                tuple(target_trans.flatten().tolist() + target_orient.flatten().tolist())
+                for _, target_trans, target_orient in batches
+            )
+
+        # every capture comes out exactly once across the workers
+        expected = captures(dataset)
+        assert len(expected) == (sample_size or 5)
+        assert captures(data_loader) == expected